@@ -1,1184 +1,1875 @@
-import sys
-import os
-import tempfile
-import shutil
-import posixpath
-import configparser
-from pathlib import Path
-
-
-from PyQt5.QtWidgets import (
-    QApplication,
-    QMainWindow,
-    QTextBrowser,
-    QFileDialog,
-    QToolBar,
-    QAction,
-    QActionGroup,
-    QMessageBox,
-    QStatusBar,
-    QInputDialog,
-    QLabel,
-    QScrollArea,
-    QStackedWidget,
-    QVBoxLayout,
-    QWidget,
-    QLineEdit,
-    QDialog,
-    QComboBox,
-    QSpinBox,
-    QPushButton,
-    QHBoxLayout,
-    QCheckBox,
-)
-from PyQt5.QtGui import (
-    QFont,
-    QPixmap,
-    QImage,
-    QColor,
-    QTextCharFormat,
-    QFontDatabase,
-    QDesktopServices,
-    QKeySequence,
-)
-from PyQt5.QtCore import Qt, QUrl, pyqtSignal
-
-from ebooklib import epub
-import ebooklib
-from bs4 import BeautifulSoup
-import fitz  # PyMuPDF
-
-APP_VERSION = "2.1.0"
-
-# Determine app directory (folder of the EXE or script)
-if getattr(sys, "frozen", False):
-    APP_DIR = Path(os.path.dirname(sys.executable))
-else:
-    APP_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
-
-XDG_CONFIG_HOME = os.getenv("XDG_CONFIG_HOME")
-if XDG_CONFIG_HOME:
-    CONFIG_DIR = Path(XDG_CONFIG_HOME) / "FeReader"
-else:
-    CONFIG_DIR = Path.home() / ".config" / "FeReader"
-
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-
-LANG_STRINGS = {
-    "en": {
-        "menu": "Menu",
-        "open": "Open",
-        "settings": "Setting",
-        "convert": "Convert",
-        "exit": "Exit",
-        "prev": "Prev",
-        "next": "Next",
-        "goto": "Go to",
-        "one_page": "One Page",
-        "all_pages": "All Pages",
-        "help": "Help",
-        "view_help": "View Help",
-        "about": "About FeReader",
-        "font": "Font",
-        "theme": "Theme",
-        "language": "Language",
-        "theme_light": "Light",
-        "theme_dark": "Dark",
-        "language_en": "English (US)",
-        "language_th": "ภาษาไทย",
-        "settings_title": "Settings",
-        "convert_title": "Convert",
-        "no_document": "No document loaded.",
-    },
-    "th": {
-        "menu": "เมนู",
-        "open": "เปิด",
-        "settings": "ตั้งค่า",
-        "convert": "แปลงเอกสาร",
-        "exit": "ออก",
-        "prev": "ก่อนหน้า",
-        "next": "ถัดไป",
-        "goto": "ข้ามหน้า",
-        "one_page": "ทีละหน้า",
-        "all_pages": "ทุกหน้า",
-        "help": "ช่วยเหลือ",
-        "view_help": "ดูการช่วยเหลือ",
-        "about": "เกี่ยวกับ FeReader",
-        "font": "ฟอนต์",
-        "theme": "ธีม",
-        "language": "ภาษา",
-        "theme_light": "โหมดสว่าง",
-        "theme_dark": "โหมดมืด",
-        "language_en": "English (US)",
-        "language_th": "ภาษาไทย",
-        "settings_title": "ตั้งค่า",
-        "convert_title": "แปลงเอกสาร",
-        "no_document": "ยังไม่มีเอกสารถูกเปิด",
-    },
-}
-
-
-class PageScrollArea(QScrollArea):
-    """Scroll area that can flip pages with mouse wheel."""
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.on_scroll_prev = None
-        self.on_scroll_next = None
-
-    def wheelEvent(self, event):
-        if self.on_scroll_prev or self.on_scroll_next:
-            delta = event.angleDelta().y()
-            bar = self.verticalScrollBar()
-            at_top = bar.value() == bar.minimum()
-            at_bottom = bar.value() == bar.maximum()
-
-            if delta > 0 and at_top and self.on_scroll_prev:
-                self.on_scroll_prev()
-                return
-            if delta < 0 and at_bottom and self.on_scroll_next:
-                self.on_scroll_next()
-                return
-        super().wheelEvent(event)
-
-
-class SettingsDialog(QDialog):
-    def __init__(self, parent, fonts, current_font, current_size, current_theme, current_lang):
-        super().__init__(parent)
-        self.setModal(True)
-        self.setWindowTitle(LANG_STRINGS[current_lang]["settings_title"])
-
-        self.font_combo = QComboBox()
-        self.font_combo.addItems(fonts)
-        if current_font in fonts:
-            self.font_combo.setCurrentText(current_font)
-
-        self.size_spin = QSpinBox()
-        self.size_spin.setRange(8, 48)
-        self.size_spin.setValue(current_size)
-
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(
-            [LANG_STRINGS[current_lang]["theme_light"], LANG_STRINGS[current_lang]["theme_dark"]]
-        )
-        if current_theme.lower() == "dark":
-            self.theme_combo.setCurrentIndex(1)
-        else:
-            self.theme_combo.setCurrentIndex(0)
-
-        self.lang_combo = QComboBox()
-        self.lang_combo.addItem(LANG_STRINGS[current_lang]["language_en"], "en")
-        self.lang_combo.addItem(LANG_STRINGS[current_lang]["language_th"], "th")
-        if current_lang == "th":
-            self.lang_combo.setCurrentIndex(1)
-        else:
-            self.lang_combo.setCurrentIndex(0)
-
-        layout = QVBoxLayout(self)
-
-        font_row = QHBoxLayout()
-        font_label = QLabel(LANG_STRINGS[current_lang]["font"] + ":")
-        font_row.addWidget(font_label)
-        font_row.addWidget(self.font_combo)
-
-        size_row = QHBoxLayout()
-        size_label = QLabel("Size:")
-        size_row.addWidget(size_label)
-        size_row.addWidget(self.size_spin)
-
-        theme_row = QHBoxLayout()
-        theme_label = QLabel(LANG_STRINGS[current_lang]["theme"] + ":")
-        theme_row.addWidget(theme_label)
-        theme_row.addWidget(self.theme_combo)
-
-        lang_row = QHBoxLayout()
-        lang_label = QLabel(LANG_STRINGS[current_lang]["language"] + ":")
-        lang_row.addWidget(lang_label)
-        lang_row.addWidget(self.lang_combo)
-
-        layout.addLayout(font_row)
-        layout.addLayout(size_row)
-        layout.addLayout(theme_row)
-        layout.addLayout(lang_row)
-
-        btn_row = QHBoxLayout()
-        ok_btn = QPushButton("OK")
-        cancel_btn = QPushButton("Cancel")
-        ok_btn.clicked.connect(self.accept)
-        cancel_btn.clicked.connect(self.reject)
-        btn_row.addStretch(1)
-        btn_row.addWidget(ok_btn)
-        btn_row.addWidget(cancel_btn)
-
-        layout.addLayout(btn_row)
-
-    def get_values(self):
-        theme = "light" if self.theme_combo.currentIndex() == 0 else "dark"
-        lang = self.lang_combo.currentData()
-        return {
-            "font_family": self.font_combo.currentText(),
-            "font_size": self.size_spin.value(),
-            "theme": theme,
-            "language": lang,
-        }
-
-
-class ConvertDialog(QDialog):
-    def __init__(self, parent, current_lang):
-        super().__init__(parent)
-        self.setModal(True)
-        self.current_lang = current_lang
-        self.setWindowTitle(LANG_STRINGS[current_lang]["convert_title"])
-
-        self.mode_combo = QComboBox()
-        self.mode_combo.addItem("Text -> PDF", "text_pdf")
-        self.mode_combo.addItem("Text -> EPUB", "text_epub")
-        self.mode_combo.addItem("Images -> PDF", "images_pdf")
-
-        self.input_label = QLabel("Input: (none)")
-        self.output_label = QLabel("Output: (none)")
-
-        self.input_btn = QPushButton("Browse input")
-        self.output_btn = QPushButton("Browse output")
-        self.input_btn.clicked.connect(self.choose_input)
-        self.output_btn.clicked.connect(self.choose_output)
-
-        self.password_check = QCheckBox("Protect with password (PDF)")
-        self.password_edit = QLineEdit()
-        self.password_edit.setEchoMode(QLineEdit.Password)
-
-        self.convert_btn = QPushButton("Convert")
-        self.cancel_btn = QPushButton("Cancel")
-        self.convert_btn.clicked.connect(self.perform_convert)
-        self.cancel_btn.clicked.connect(self.reject)
-
-        layout = QVBoxLayout(self)
-        layout.addWidget(QLabel("Mode:"))
-        layout.addWidget(self.mode_combo)
-        layout.addWidget(self.input_label)
-        layout.addWidget(self.input_btn)
-        layout.addWidget(self.output_label)
-        layout.addWidget(self.output_btn)
-        layout.addWidget(self.password_check)
-        layout.addWidget(self.password_edit)
-
-        btn_row = QHBoxLayout()
-        btn_row.addStretch(1)
-        btn_row.addWidget(self.convert_btn)
-        btn_row.addWidget(self.cancel_btn)
-        layout.addLayout(btn_row)
-
-        self.input_paths = []
-        self.output_path = ""
-
-    def choose_input(self):
-        mode = self.mode_combo.currentData()
-        if mode == "images_pdf":
-            paths, _ = QFileDialog.getOpenFileNames(
-                self, "Select images", "", "Images (*.png *.jpg *.jpeg *.bmp)"
-            )
-            if paths:
-                self.input_paths = paths
-                self.input_label.setText(f"Input: {len(paths)} image(s) selected")
-        else:
-            path, _ = QFileDialog.getOpenFileName(
-                self, "Select text file", "", "Text files (*.txt);;All files (*.*)"
-            )
-            if path:
-                self.input_paths = [path]
-                self.input_label.setText(f"Input: {os.path.basename(path)}")
-
-    def choose_output(self):
-        mode = self.mode_combo.currentData()
-        if mode in ("text_pdf", "images_pdf"):
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Save PDF", "", "PDF files (*.pdf)"
-            )
-        else:
-            path, _ = QFileDialog.getSaveFileName(
-                self, "Save EPUB", "", "EPUB files (*.epub)"
-            )
-        if path:
-            self.output_path = path
-            self.output_label.setText(f"Output: {os.path.basename(path)}")
-
-    def perform_convert(self):
-        mode = self.mode_combo.currentData()
-        if not self.input_paths:
-            QMessageBox.warning(self, "Error", "No input selected.")
-            return
-        if not self.output_path:
-            QMessageBox.warning(self, "Error", "No output selected.")
-            return
-
-        try:
-            if mode == "text_pdf":
-                self._convert_text_to_pdf()
-            elif mode == "text_epub":
-                self._convert_text_to_epub()
-            elif mode == "images_pdf":
-                self._convert_images_to_pdf()
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Conversion failed:\n{e}")
-            return
-
-        QMessageBox.information(self, "Success", "Conversion completed.")
-        self.accept()
-
-    def _convert_text_to_pdf(self):
-        path = self.input_paths[0]
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-
-        doc = fitz.open()
-        page = doc.new_page()
-        rect = fitz.Rect(50, 50, 550, 800)
-        page.insert_textbox(rect, text, fontsize=11, align=0)
-
-        if self.password_check.isChecked() and self.password_edit.text():
-            pw = self.password_edit.text()
-            doc.save(
-                self.output_path,
-                encryption=fitz.PDF_ENCRYPT_AES_128,
-                owner_pw=pw,
-                user_pw=pw,
-            )
-        else:
-            doc.save(self.output_path)
-
-        doc.close()
-
-    def _convert_text_to_epub(self):
-        path = self.input_paths[0]
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            text = f.read()
-
-        book = epub.EpubBook()
-        book.set_identifier("fereader-convert")
-        book.set_title(os.path.basename(path))
-        book.set_language("en")
-
-        chapter = epub.EpubHtml(title="Chapter 1", file_name="chap_1.xhtml", lang="en")
-        chapter.content = f"<html><body><pre>{text}</pre></body></html>"
-        book.add_item(chapter)
-
-        book.toc = (chapter,)
-        book.add_item(epub.EpubNcx())
-        book.add_item(epub.EpubNav())
-        book.spine = ["nav", chapter]
-
-        epub.write_epub(self.output_path, book)
-
-    def _convert_images_to_pdf(self):
-        doc = fitz.open()
-        for img_path in self.input_paths:
-            img_doc = fitz.open(img_path)
-            rect = img_doc[0].rect
-            page = doc.new_page(width=rect.width, height=rect.height)
-            page.insert_image(rect, filename=img_path)
-            img_doc.close()
-
-        if self.password_check.isChecked() and self.password_edit.text():
-            pw = self.password_edit.text()
-            doc.save(
-                self.output_path,
-                encryption=fitz.PDF_ENCRYPT_AES_128,
-                owner_pw=pw,
-                user_pw=pw,
-            )
-        else:
-            doc.save(self.output_path)
-        doc.close()
-
-
-class ClickableLabel(QLabel):
-    clicked = pyqtSignal()
-
-    def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.clicked.emit()
-        super().mousePressEvent(event)
-
-
-class FeReaderWindow(QMainWindow):
-    def __init__(self):
-        super().__init__()
-
-        self.config_path = str(CONFIG_DIR / "settings.ini")
-        self.config = configparser.ConfigParser()
-        self._load_or_create_settings()
-
-        self.language = self.config["General"]["language"]
-        self.theme = self.config["General"]["theme"]
-        self.font_family = self.config["General"]["font_family"]
-        self.base_font_size = int(self.config["General"]["font_size"])
-
-        self.current_book_type = None
-        self.current_book_path = None
-        self.current_book_title = "Untitled"
-        self.pages = []
-        self.current_index = 0
-        self.current_font_size = self.base_font_size
-        self.current_zoom = 1.0
-        self.pdf_images = []
-        self.epub_temp_dir = None
-        self.view_mode = "single"
-        self._continuous_needs_build = True
-
-        self._load_user_fonts()
-
-        self.setWindowTitle(f"FeReader - PDF & EPUB Viewer Version {APP_VERSION}")
-        self.resize(1000, 700)
-
-        self.stack = QStackedWidget()
-
-        self.text_view = QTextBrowser()
-        self.text_view.setOpenExternalLinks(True)
-        self.text_view.setFont(QFont(self.font_family, self.current_font_size))
-        self.text_view.selectionChanged.connect(self._handle_text_selection)
-
-        self.single_image_label = QLabel()
-        self.single_image_label.setAlignment(Qt.AlignCenter)
-
-        self.single_scroll = PageScrollArea()
-        self.single_scroll.setWidgetResizable(True)
-        self.single_scroll.setWidget(self.single_image_label)
-        self.single_scroll.on_scroll_prev = self.go_prev
-        self.single_scroll.on_scroll_next = self.go_next
-
-        self.multi_container = QWidget()
-        self.multi_layout = QVBoxLayout(self.multi_container)
-        self.multi_layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
-        self.multi_layout.setContentsMargins(0, 0, 0, 0)
-        self.multi_layout.setSpacing(16)
-
-        self.multi_scroll = QScrollArea()
-        self.multi_scroll.setWidgetResizable(True)
-        self.multi_scroll.setWidget(self.multi_container)
-
-        self.stack.addWidget(self.text_view)
-        self.stack.addWidget(self.single_scroll)
-        self.stack.addWidget(self.multi_scroll)
-        self.setCentralWidget(self.stack)
-
-        self._create_toolbar()
-        self._create_statusbar()
-
-        self.apply_theme()
-        self.apply_language()
-        self._update_view()
-
-    # ---------------- Settings handling ----------------
-
-    def _load_or_create_settings(self):
-        defaults = {
-            "theme": "light",
-            "font_family": "Segoe UI",
-            "font_size": "12",
-            "language": "en",
-        }
-        if os.path.exists(self.config_path):
-            try:
-                self.config.read(self.config_path, encoding="utf-8")
-            except Exception:
-                self.config = configparser.ConfigParser()
-        if "General" not in self.config:
-            self.config["General"] = {}
-        general = self.config["General"]
-        for key, value in defaults.items():
-            general.setdefault(key, value)
-
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            self.config.write(f)
-
-    def save_settings(self):
-        general = self.config["General"]
-        general["theme"] = self.theme
-        general["font_family"] = self.font_family
-        general["font_size"] = str(self.base_font_size)
-        general["language"] = self.language
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            self.config.write(f)
-
-    def _load_user_fonts(self):
-        for name in os.listdir(APP_DIR):
-            if name.lower().endswith((".ttf", ".otf")):
-                try:
-                    QFontDatabase.addApplicationFont(os.path.join(APP_DIR, name))
-                except Exception:
-                    pass
-
-    # ---------------- Localization & theme ----------------
-
-    def tr(self, key):
-        bundle = LANG_STRINGS.get(self.language, LANG_STRINGS["en"])
-        return bundle.get(key, key)
-
-    def apply_language(self):
-        self.menu_button.setText(self.tr("menu"))
-        self.prev_action.setText(self.tr("prev"))
-        self.next_action.setText(self.tr("next"))
-        self.goto_action.setText(self.tr("goto"))
-        self.one_page_action.setText(self.tr("one_page"))
-        self.all_pages_action.setText(self.tr("all_pages"))
-        self.help_button.setText(self.tr("help"))
-
-        self.menu_button.setToolTip(self.tr("menu"))
-        self.help_button.setToolTip(self.tr("help"))
-
-        self.open_action.setText(self.tr("open"))
-        self.settings_action.setText(self.tr("settings"))
-        self.convert_action.setText(self.tr("convert"))
-        self.exit_action.setText(self.tr("exit"))
-
-        self.view_help_action.setText(self.tr("view_help"))
-        self.about_action.setText(self.tr("about"))
-
-    def apply_theme(self):
-        """Apply light/dark theme including toolbar and hide menu indicators."""
-        if self.theme == "dark":
-            self.setStyleSheet(
-                """
-            QMainWindow {
-                background-color: #202020;
-                color: #f0f0f0;
-            }
-            QTextBrowser {
-                background-color: #202020;
-                color: #f0f0f0;
-            }
-            QLabel {
-                color: #f0f0f0;
-            }
-
-            /* Toolbar should stay light in dark mode */
-            QToolBar {
-                background: #f5f5f5;
-                border: none;
-                spacing: 6px;
-            }
-
-            QToolButton {
-                background: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-                padding: 4px 8px;
-                border-radius: 3px;
-            }
-            QToolButton:hover {
-                background: #eaeaea;
-            }
-            QToolButton:pressed {
-                background: #dddddd;
-            }
-            QToolButton:checked {
-                background: #d0d0d0;
-                border: 1px solid #aaaaaa;
-            }
-
-            /* Hide small triangle on menu buttons */
-            QToolButton::menu-indicator {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-
-            QScrollArea {
-                background: #202020;
-            }
-            QScrollArea QWidget {
-                background: #202020;
-            }
-            """
-            )
-        else:
-            self.setStyleSheet(
-                """
-            QMainWindow {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            QTextBrowser {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            QLabel {
-                color: #000000;
-            }
-
-            QToolBar {
-                background: #f2f2f2;
-                border: none;
-                spacing: 6px;
-            }
-
-            QToolButton {
-                background: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-                padding: 4px 8px;
-                border-radius: 3px;
-            }
-            QToolButton:hover {
-                background: #eaeaea;
-            }
-            QToolButton:pressed {
-                background: #dddddd;
-            }
-            QToolButton:checked {
-                background: #d0d0d0;
-                border: 1px solid #aaaaaa;
-            }
-
-            /* Hide small triangle on menu buttons */
-            QToolButton::menu-indicator {
-                image: none;
-                width: 0px;
-                height: 0px;
-            }
-
-            QScrollArea {
-                background: #ffffff;
-            }
-            QScrollArea QWidget {
-                background: #ffffff;
-            }
-            """
-            )
-
-    # ---------------- UI creation ----------------
-
-    def _create_toolbar(self):
-        toolbar = QToolBar("Main Toolbar")
-        toolbar.setMovable(False)
-        self.addToolBar(toolbar)
-
-        from PyQt5.QtWidgets import QToolButton, QMenu
-
-        self.menu_button = QToolButton()
-        self.menu_button.setPopupMode(QToolButton.InstantPopup)
-        self.menu_menu = QMenu()
-
-        # Actions with shortcuts (no shortcuts inside text)
-        self.open_action = QAction(self.tr("open"), self)
-        self.open_action.setShortcut(QKeySequence("Ctrl+O"))
-        self.open_action.triggered.connect(self.open_file)
-
-        self.settings_action = QAction(self.tr("settings"), self)
-        self.settings_action.setShortcut(QKeySequence("F1"))
-        self.settings_action.triggered.connect(self.open_settings_dialog)
-
-        self.convert_action = QAction(self.tr("convert"), self)
-        self.convert_action.setShortcut(QKeySequence("F2"))
-        self.convert_action.triggered.connect(self.open_convert_dialog)
-
-        self.exit_action = QAction(self.tr("exit"), self)
-        self.exit_action.setShortcut(QKeySequence("Alt+F4"))
-        self.exit_action.triggered.connect(QApplication.instance().quit)
-
-        self.menu_menu.addAction(self.open_action)
-        self.menu_menu.addAction(self.settings_action)
-        self.menu_menu.addAction(self.convert_action)
-        self.menu_menu.addSeparator()
-        self.menu_menu.addAction(self.exit_action)
-
-        self.menu_button.setMenu(self.menu_menu)
-        self.menu_button.setText(self.tr("menu"))
-        toolbar.addWidget(self.menu_button)
-
-        toolbar.addSeparator()
-
-        self.prev_action = QAction(self.tr("prev"), self)
-        self.prev_action.triggered.connect(self.go_prev)
-        toolbar.addAction(self.prev_action)
-
-        self.next_action = QAction(self.tr("next"), self)
-        self.next_action.triggered.connect(self.go_next)
-        toolbar.addAction(self.next_action)
-
-        self.goto_action = QAction(self.tr("goto"), self)
-        self.goto_action.triggered.connect(self.go_to_page_dialog)
-        toolbar.addAction(self.goto_action)
-
-        toolbar.addSeparator()
-
-        zoom_in_action = QAction("🔍+", self)
-        zoom_in_action.setStatusTip("Zoom in / increase font size")
-        zoom_in_action.triggered.connect(self.zoom_in)
-        toolbar.addAction(zoom_in_action)
-
-        zoom_out_action = QAction("🔍-", self)
-        zoom_out_action.setStatusTip("Zoom out / decrease font size")
-        zoom_out_action.triggered.connect(self.zoom_out)
-        toolbar.addAction(zoom_out_action)
-
-        # Clickable zoom label
-        self.zoom_label = ClickableLabel("100%")
-        self.zoom_label.setMinimumWidth(60)
-        self.zoom_label.setAlignment(Qt.AlignCenter)
-        self.zoom_label.clicked.connect(self.zoom_label_clicked)
-        toolbar.addWidget(self.zoom_label)
-
-        toolbar.addSeparator()
-
-        self.one_page_action = QAction(self.tr("one_page"), self)
-        self.one_page_action.setCheckable(True)
-        self.one_page_action.setChecked(True)
-
-        self.all_pages_action = QAction(self.tr("all_pages"), self)
-        self.all_pages_action.setCheckable(True)
-        self.all_pages_action.setChecked(False)
-
-        view_group = QActionGroup(self)
-        view_group.setExclusive(True)
-        view_group.addAction(self.one_page_action)
-        view_group.addAction(self.all_pages_action)
-
-        self.one_page_action.triggered.connect(lambda: self.set_view_mode("single"))
-        self.all_pages_action.triggered.connect(lambda: self.set_view_mode("continuous"))
-
-        toolbar.addAction(self.one_page_action)
-        toolbar.addAction(self.all_pages_action)
-
-        toolbar.addSeparator()
-
-        self.help_button = QToolButton()
-        self.help_button.setPopupMode(QToolButton.InstantPopup)
-        help_menu = QMenu()
-
-        self.view_help_action = QAction(self.tr("view_help"), self)
-        self.view_help_action.triggered.connect(
-            lambda: QDesktopServices.openUrl(
-                QUrl("https://github.com/Sauna-in-The-Sun/FeReader")
-            )
-        )
-        self.about_action = QAction(self.tr("about"), self)
-        self.about_action.triggered.connect(self.show_about)
-
-        help_menu.addAction(self.view_help_action)
-        help_menu.addAction(self.about_action)
-
-        self.help_button.setMenu(help_menu)
-        self.help_button.setText(self.tr("help"))
-        toolbar.addWidget(self.help_button)
-
-    def _create_statusbar(self):
-        status = QStatusBar()
-        self.setStatusBar(status)
-        self._update_statusbar()
-
-    def _update_statusbar(self):
-        if self.pages:
-            info = f"{self.current_book_title}  |  Page {self.current_index + 1} / {len(self.pages)}"
-        else:
-            info = self.tr("no_document")
-        self.statusBar().showMessage(info)
-
-    def _update_zoom_label(self):
-        """Update zoom label text (percentage) only."""
-        if not self.pages:
-            self.zoom_label.setText("100%")
-            return
-
-        if self.current_book_type == "pdf":
-            percent = int(self.current_zoom * 100)
-        else:
-            ratio = self.current_font_size / float(self.base_font_size)
-            percent = int(ratio * 100)
-
-        self.zoom_label.setText(f"{percent}%")
-
-    def zoom_label_clicked(self):
-        """Handle click on zoom label: let user type percentage."""
-        if not self.pages:
-            return
-
-        if self.current_book_type == "pdf":
-            current_percent = int(self.current_zoom * 100)
-        else:
-            current_percent = int(
-                self.current_font_size / float(self.base_font_size) * 100
-            )
-
-        value, ok = QInputDialog.getInt(
-            self,
-            "Set Zoom",
-            "Enter zoom percentage (50 - 300):",
-            value=current_percent,
-            min=50,
-            max=300,
-        )
-
-        if not ok:
-            return
-
-        if self.current_book_type == "pdf":
-            self.current_zoom = value / 100.0
-            if self.current_zoom < 0.5:
-                self.current_zoom = 0.5
-            if self.current_zoom > 3.0:
-                self.current_zoom = 3.0
-            if self.view_mode == "continuous":
-                self._continuous_needs_build = True
-        else:
-            new_size = int(self.base_font_size * (value / 100.0))
-            if new_size < 8:
-                new_size = 8
-            if new_size > 40:
-                new_size = 40
-            self.current_font_size = new_size
-
-        self._update_view()
-
-    # ---------------- File handling ----------------
-
-    def open_file(self):
-        dialog_filter = (
-            "Documents (*.pdf *.epub);;"
-            "PDF Files (*.pdf);;"
-            "EPUB Files (*.epub);;"
-            "All Files (*.*)"
-        )
-
-        path, _ = QFileDialog.getOpenFileName(self, "Open document", "", dialog_filter)
-        if not path:
-            return
-        ext = os.path.splitext(path)[1].lower()
-        try:
-            if ext == ".pdf":
-                self.load_pdf(path)
-            elif ext == ".epub":
-                self.load_epub(path)
-            else:
-                QMessageBox.warning(
-                    self, "Unsupported file", "Only PDF and EPUB are supported."
-                )
-                return
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
-            return
-
-        self.current_book_path = path
-        self.current_book_title = os.path.basename(path)
-        self.current_index = 0
-        self._update_view()
-
-    # -------- PDF (image-based rendering with PyMuPDF) --------
-
-    def load_pdf(self, path):
-        self.current_book_type = "pdf"
-        self.pages = []
-        self.pdf_images = []
-        self.current_zoom = 1.0
-        self.view_mode = "single"
-        self.one_page_action.setChecked(True)
-        self.all_pages_action.setChecked(False)
-        self._continuous_needs_build = True
-
-        doc = fitz.open(path)
-
-        if doc.needs_pass:
-            password, ok = QInputDialog.getText(
-                self,
-                "Password Required",
-                "This PDF is encrypted.\nEnter password:",
-                QLineEdit.Password,
-            )
-            if not ok or not password:
-                QMessageBox.warning(self, "Cancelled", "Cannot open encrypted PDF.")
-                doc.close()
-                return
-            if not doc.authenticate(password):
-                QMessageBox.critical(self, "Error", "Incorrect password.")
-                doc.close()
-                return
-
-        for page in doc:
-            pix = page.get_pixmap(alpha=True)
-            img = QImage(
-                pix.samples,
-                pix.width,
-                pix.height,
-                pix.stride,
-                QImage.Format_RGBA8888,
-            )
-            img = img.copy()
-            self.pdf_images.append(img)
-            self.pages.append(len(self.pages))
-        doc.close()
-
-    # -------- EPUB (HTML + inline images) --------
-
-    def _cleanup_epub_temp(self):
-        if self.epub_temp_dir and os.path.isdir(self.epub_temp_dir):
-            try:
-                shutil.rmtree(self.epub_temp_dir, ignore_errors=True)
-            except Exception:
-                pass
-        self.epub_temp_dir = None
-
-    def load_epub(self, path):
-        self.current_book_type = "epub"
-        self.pages = []
-        self.current_font_size = self.base_font_size
-
-        self._cleanup_epub_temp()
-        self.epub_temp_dir = tempfile.mkdtemp(prefix="fereader_epub_")
-
-        book = epub.read_epub(path)
-
-        for item in book.get_items():
-            content = item.get_content()
-            rel_path = item.file_name.replace("/", os.sep)
-            out_path = os.path.join(self.epub_temp_dir, rel_path)
-            os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            with open(out_path, "wb") as f:
-                f.write(content)
-
-        for item in book.get_items_of_type(ebooklib.ITEM_DOCUMENT):
-            html_bytes = item.get_content()
-            html = html_bytes.decode("utf-8", errors="ignore")
-
-            html_dir = posixpath.dirname(item.file_name)
-            soup = BeautifulSoup(html, "html.parser")
-
-            for img_tag in soup.find_all("img"):
-                src = img_tag.get("src")
-                if not src:
-                    continue
-                rel = posixpath.normpath(posixpath.join(html_dir, src))
-                local_path = os.path.join(
-                    self.epub_temp_dir,
-                    rel.replace("/", os.sep),
-                )
-                file_url = QUrl.fromLocalFile(local_path).toString()
-                img_tag["src"] = file_url
-
-            clean_html = str(soup)
-            self.pages.append(clean_html)
-
-        if not self.pages:
-            self.pages.append("<h3>No readable content found.</h3>")
-
-    # ---------------- PDF continuous view helpers ----------------
-
-    def _clear_multi_layout(self):
-        while self.multi_layout.count():
-            item = self.multi_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-
-    def _build_continuous_pdf_widgets(self):
-        self._clear_multi_layout()
-        zoom = self.current_zoom
-        if zoom <= 0:
-            zoom = 1.0
-        for img in self.pdf_images:
-            w = int(img.width() * zoom)
-            h = int(img.height() * zoom)
-            scaled = img.scaled(
-                w,
-                h,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation,
-            )
-            lbl = QLabel()
-            lbl.setAlignment(Qt.AlignCenter)
-            lbl.setPixmap(QPixmap.fromImage(scaled))
-            self.multi_layout.addWidget(lbl)
-
-        self.multi_layout.addStretch(1)
-        self._continuous_needs_build = False
-
-    # ---------------- Navigation & rendering ----------------
-
-    def _update_view(self):
-        if not self.pages:
-            self.stack.setCurrentWidget(self.text_view)
-            self.text_view.setPlainText(self.tr("no_document"))
-            self._update_statusbar()
-            self._update_zoom_label()
-            return
-
-        if self.current_book_type == "epub":
-            self.stack.setCurrentWidget(self.text_view)
-            content = self.pages[self.current_index]
-            self.text_view.setHtml(content)
-            font = QFont(self.font_family, self.current_font_size)
-            self.text_view.setFont(font)
-
-        elif self.current_book_type == "pdf":
-            if self.view_mode == "single":
-                self.stack.setCurrentWidget(self.single_scroll)
-                if 0 <= self.current_index < len(self.pdf_images):
-                    base_img = self.pdf_images[self.current_index]
-                    zoom = self.current_zoom if self.current_zoom > 0 else 1.0
-                    w = int(base_img.width() * zoom)
-                    h = int(base_img.height() * zoom)
-                    scaled = base_img.scaled(
-                        w,
-                        h,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation,
-                    )
-                    pix = QPixmap.fromImage(scaled)
-                    self.single_image_label.setPixmap(pix)
-                    self.single_image_label.adjustSize()
-                else:
-                    self.single_image_label.clear()
-            else:
-                self.stack.setCurrentWidget(self.multi_scroll)
-                if self._continuous_needs_build:
-                    self._build_continuous_pdf_widgets()
-
-        self._update_statusbar()
-        self._update_zoom_label()
-
-    def go_prev(self):
-        if not self.pages:
-            return
-        if self.current_index > 0:
-            self.current_index -= 1
-            self._update_view()
-
-    def go_next(self):
-        if not self.pages:
-            return
-        if self.current_index < len(self.pages) - 1:
-            self.current_index += 1
-            self._update_view()
-
-    def go_to_page_dialog(self):
-        if not self.pages:
-            return
-        max_page = len(self.pages)
-        current_page_display = self.current_index + 1
-        value, ok = QInputDialog.getInt(
-            self,
-            "Go to page",
-            f"Enter page number (1 - {max_page}):",
-            value=current_page_display,
-            min=1,
-            max=max_page,
-        )
-        if ok:
-            self.current_index = value - 1
-            self._update_view()
-
-    # ---------------- Zoom ----------------
-
-    def zoom_in(self):
-        if not self.pages:
-            return
-        if self.current_book_type == "pdf":
-            self.current_zoom += 0.15
-            if self.current_zoom > 3.0:
-                self.current_zoom = 3.0
-            if self.view_mode == "continuous":
-                self._continuous_needs_build = True
-        else:
-            self.current_font_size += 1
-            if self.current_font_size > 40:
-                self.current_font_size = 40
-        self._update_view()
-
-    def zoom_out(self):
-        if not self.pages:
-            return
-        if self.current_book_type == "pdf":
-            self.current_zoom -= 0.15
-            if self.current_zoom < 0.5:
-                self.current_zoom = 0.5
-            if self.view_mode == "continuous":
-                self._continuous_needs_build = True
-        else:
-            self.current_font_size -= 1
-            if self.current_font_size < 8:
-                self.current_font_size = 8
-        self._update_view()
-
-    # ---------------- View mode ----------------
-
-    def set_view_mode(self, mode: str):
-        if self.current_book_type != "pdf":
-            return
-        if mode == "single":
-            self.view_mode = "single"
-            self.one_page_action.setChecked(True)
-            self.all_pages_action.setChecked(False)
-        elif mode == "continuous":
-            self.view_mode = "continuous"
-            self.one_page_action.setChecked(False)
-            self.all_pages_action.setChecked(True)
-            self._continuous_needs_build = True
-        else:
-            return
-        self._update_view()
-
-    # ---------------- Text highlight ----------------
-
-    def _handle_text_selection(self):
-        if self.current_book_type != "epub":
-            return
-        cursor = self.text_view.textCursor()
-        if not cursor or not cursor.hasSelection():
-            return
-        fmt = QTextCharFormat()
-        fmt.setBackground(QColor(255, 255, 0, 128))
-        cursor.mergeCharFormat(fmt)
-
-    # ---------------- Settings / Help / Convert ----------------
-
-    def open_settings_dialog(self):
-        fonts = sorted(set(QFontDatabase().families()))
-        dlg = SettingsDialog(
-            self,
-            fonts,
-            self.font_family,
-            self.base_font_size,
-            self.theme,
-            self.language,
-        )
-        if dlg.exec_() == QDialog.Accepted:
-            values = dlg.get_values()
-            self.font_family = values["font_family"]
-            self.base_font_size = values["font_size"]
-            self.current_font_size = self.base_font_size
-            self.theme = values["theme"]
-            self.language = values["language"]
-            self.apply_theme()
-            self.apply_language()
-            self.save_settings()
-            self._update_view()
-
-    def open_convert_dialog(self):
-        dlg = ConvertDialog(self, self.language)
-        dlg.exec_()
-
-    def show_about(self):
-        text = (
-            f"FeReader Version {APP_VERSION}\n"
-            "PDF & EPUB Viewer with page navigation, zoom, and image support.\n"
-            "Powered by PyQt5, PyMuPDF, and ebooklib.\n"
-            "Copyright \u00a9 ImBad / Neofilisoft"
-        )
-        QMessageBox.information(self, "About FeReader", text)
-
-    # ---------------- Lifecycle ----------------
-
-    def closeEvent(self, event):
-        self._cleanup_epub_temp()
-        self.save_settings()
-        event.accept()
-
-
-def main():
-    app = QApplication(sys.argv)
-    window = FeReaderWindow()
-    window.show()
-    sys.exit(app.exec_())
-
-
-if __name__ == "__main__":
-    main()
+import sys
+import os
+import bisect
+import collections
+import functools
+import hashlib
+import html
+import mmap
+import posixpath
+import re
+import configparser
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QMainWindow,
+    QTextBrowser,
+    QFileDialog,
+    QToolBar,
+    QAction,
+    QActionGroup,
+    QMessageBox,
+    QStatusBar,
+    QInputDialog,
+    QLabel,
+    QScrollArea,
+    QStackedWidget,
+    QVBoxLayout,
+    QWidget,
+    QLineEdit,
+    QDialog,
+    QComboBox,
+    QSpinBox,
+    QPushButton,
+    QHBoxLayout,
+    QCheckBox,
+)
+from PyQt5.QtGui import (
+    QFont,
+    QPixmap,
+    QPixmapCache,
+    QImage,
+    QColor,
+    QTextCharFormat,
+    QTextDocument,
+    QFontDatabase,
+    QDesktopServices,
+    QKeySequence,
+)
+from PyQt5.QtCore import (
+    Qt,
+    QUrl,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+
+# PyMuPDF (fitz), ebooklib and bs4 are imported lazily inside the
+# functions that need them: together they add hundreds of ms to cold
+# start, and a user who never opens a book shouldn't pay for them.
+
+APP_VERSION = "2.1.0"
+
+# Determine app directory (folder of the EXE or script)
+if getattr(sys, "frozen", False):
+    APP_DIR = Path(os.path.dirname(sys.executable))
+else:
+    APP_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
+
+@functools.lru_cache(maxsize=1)
+def _get_config_dir():
+    xdg_config_home = os.getenv("XDG_CONFIG_HOME")
+    if xdg_config_home:
+        config_dir = Path(xdg_config_home) / "FeReader"
+    else:
+        config_dir = Path.home() / ".config" / "FeReader"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
+
+CONFIG_DIR = _get_config_dir()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_page_cache_dir():
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        cache_dir = Path(xdg_cache_home) / "FeReader" / "pages"
+    else:
+        cache_dir = Path.home() / ".cache" / "FeReader" / "pages"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+_PAGE_CACHE_LIMIT = 512 * 1024 * 1024
+
+
+def _prune_page_cache(limit=_PAGE_CACHE_LIMIT):
+    """Delete the oldest cached page renders until the on-disk cache
+    fits under the limit again."""
+    entries = []
+    total = 0
+    for root, _dirs, files in os.walk(_get_page_cache_dir()):
+        for name in files:
+            file_path = os.path.join(root, name)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, file_path))
+            total += st.st_size
+    if total <= limit:
+        return
+    entries.sort()
+    for _mtime, size, file_path in entries:
+        try:
+            os.unlink(file_path)
+        except OSError:
+            continue
+        total -= size
+        if total <= limit:
+            return
+
+
+def _doc_cache_key(path):
+    """Cheap stable identity for a document; size+mtime is enough to
+    notice the file being replaced without hashing its contents."""
+    st = os.stat(path)
+    ident = f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}"
+    return hashlib.sha1(ident.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _all_font_families():
+    """Scan the system font database once; the set of installed fonts
+    does not change within a session."""
+    return tuple(sorted(set(QFontDatabase().families())))
+
+
+def _probe_image_size(path):
+    """Return (width, height) of an image by opening it with MuPDF."""
+    import fitz
+
+    img_doc = fitz.open(path)
+    try:
+        rect = img_doc[0].rect
+        return rect.width, rect.height
+    finally:
+        img_doc.close()
+
+
+# Free-typed zoom percentages would give every value its own cache
+# entry; rendering snaps to this ladder so the caches actually hit.
+_ZOOM_STEPS = (0.5, 0.65, 0.8, 1.0, 1.15, 1.3, 1.5, 1.75, 2.0, 2.5, 3.0)
+
+
+def _snap_zoom(zoom):
+    return min(_ZOOM_STEPS, key=lambda step: abs(step - zoom))
+
+
+def _zoom_step(zoom, direction):
+    """The next ladder stop above (direction > 0) or below the given
+    zoom, clamped to the ends of the ladder."""
+    if direction > 0:
+        i = bisect.bisect_right(_ZOOM_STEPS, zoom)
+        return _ZOOM_STEPS[min(i, len(_ZOOM_STEPS) - 1)]
+    i = bisect.bisect_left(_ZOOM_STEPS, zoom)
+    return _ZOOM_STEPS[max(i - 1, 0)]
+
+
+# Only <img src> attributes change during chapter rewriting, so a regex
+# substitution on the raw bytes replaces the parse + str(soup) round-trip.
+_IMG_TAG_RE = re.compile(rb"<img", re.IGNORECASE)
+_IMG_SRC_RE = re.compile(
+    rb"(<img\b[^>]*?\bsrc\s*=\s*[\"'])([^\"']+)([\"'])", re.IGNORECASE
+)
+
+# Asset references pulled from stylesheets (fonts, background images).
+_CSS_URL_RE = re.compile(rb"url\(\s*[\"']?([^\"')]+?)[\"']?\s*\)", re.IGNORECASE)
+
+
+def _soup_img_srcs(html_bytes):
+    """Collect <img> src values the byte regex may have missed, parsing
+    only the img elements via SoupStrainer."""
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    soup = BeautifulSoup(
+        html_bytes, _bs_parser(), parse_only=SoupStrainer("img")
+    )
+    return [tag["src"] for tag in soup.find_all("img") if tag.get("src")]
+
+
+def _iter_text_lines(path):
+    """Yield decoded lines from a text file via mmap, without ever
+    materializing the whole file as one Python string."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw in iter(mm.readline, b""):
+                yield raw.decode("utf-8", "ignore").rstrip("\r\n")
+
+
+def _wrap_pdf_line(line, font, fontsize, max_width):
+    """Break a line into pieces no wider than max_width points,
+    splitting at spaces and hard-breaking words that alone exceed it."""
+    if font.text_length(line, fontsize=fontsize) <= max_width:
+        yield line
+        return
+    piece = ""
+    for word in line.split(" "):
+        candidate = f"{piece} {word}" if piece else word
+        if font.text_length(candidate, fontsize=fontsize) <= max_width:
+            piece = candidate
+            continue
+        if piece:
+            yield piece
+        while font.text_length(word, fontsize=fontsize) > max_width:
+            cut = len(word)
+            while cut > 1 and (
+                font.text_length(word[:cut], fontsize=fontsize) > max_width
+            ):
+                cut -= 1
+            yield word[:cut]
+            word = word[cut:]
+        piece = word
+    if piece:
+        yield piece
+
+
+@functools.lru_cache(maxsize=1)
+def _bs_parser():
+    """Prefer lxml's C parser for EPUB chapters when it is installed."""
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+LANG_STRINGS = {
+    "en": {
+        "menu": "Menu",
+        "open": "Open",
+        "settings": "Setting",
+        "convert": "Convert",
+        "exit": "Exit",
+        "prev": "Prev",
+        "next": "Next",
+        "goto": "Go to",
+        "one_page": "One Page",
+        "all_pages": "All Pages",
+        "help": "Help",
+        "view_help": "View Help",
+        "about": "About FeReader",
+        "font": "Font",
+        "theme": "Theme",
+        "language": "Language",
+        "theme_light": "Light",
+        "theme_dark": "Dark",
+        "language_en": "English (US)",
+        "language_th": "ภาษาไทย",
+        "settings_title": "Settings",
+        "convert_title": "Convert",
+        "no_document": "No document loaded.",
+    },
+    "th": {
+        "menu": "เมนู",
+        "open": "เปิด",
+        "settings": "ตั้งค่า",
+        "convert": "แปลงเอกสาร",
+        "exit": "ออก",
+        "prev": "ก่อนหน้า",
+        "next": "ถัดไป",
+        "goto": "ข้ามหน้า",
+        "one_page": "ทีละหน้า",
+        "all_pages": "ทุกหน้า",
+        "help": "ช่วยเหลือ",
+        "view_help": "ดูการช่วยเหลือ",
+        "about": "เกี่ยวกับ FeReader",
+        "font": "ฟอนต์",
+        "theme": "ธีม",
+        "language": "ภาษา",
+        "theme_light": "โหมดสว่าง",
+        "theme_dark": "โหมดมืด",
+        "language_en": "English (US)",
+        "language_th": "ภาษาไทย",
+        "settings_title": "ตั้งค่า",
+        "convert_title": "แปลงเอกสาร",
+        "no_document": "ยังไม่มีเอกสารถูกเปิด",
+    },
+}
+
+
+_DARK_QSS = """
+            QMainWindow {
+                background-color: #202020;
+                color: #f0f0f0;
+            }
+            QTextBrowser {
+                background-color: #202020;
+                color: #f0f0f0;
+            }
+            QLabel {
+                color: #f0f0f0;
+            }
+
+            /* Toolbar should stay light in dark mode */
+            QToolBar {
+                background: #f5f5f5;
+                border: none;
+                spacing: 6px;
+            }
+
+            QToolButton {
+                background: #ffffff;
+                color: #000000;
+                border: 1px solid #cccccc;
+                padding: 4px 8px;
+                border-radius: 3px;
+            }
+            QToolButton:hover {
+                background: #eaeaea;
+            }
+            QToolButton:pressed {
+                background: #dddddd;
+            }
+            QToolButton:checked {
+                background: #d0d0d0;
+                border: 1px solid #aaaaaa;
+            }
+
+            /* Hide small triangle on menu buttons */
+            QToolButton::menu-indicator {
+                image: none;
+                width: 0px;
+                height: 0px;
+            }
+
+            QScrollArea {
+                background: #202020;
+            }
+            QScrollArea QWidget {
+                background: #202020;
+            }
+"""
+
+_LIGHT_QSS = """
+            QMainWindow {
+                background-color: #ffffff;
+                color: #000000;
+            }
+            QTextBrowser {
+                background-color: #ffffff;
+                color: #000000;
+            }
+            QLabel {
+                color: #000000;
+            }
+
+            QToolBar {
+                background: #f2f2f2;
+                border: none;
+                spacing: 6px;
+            }
+
+            QToolButton {
+                background: #ffffff;
+                color: #000000;
+                border: 1px solid #cccccc;
+                padding: 4px 8px;
+                border-radius: 3px;
+            }
+            QToolButton:hover {
+                background: #eaeaea;
+            }
+            QToolButton:pressed {
+                background: #dddddd;
+            }
+            QToolButton:checked {
+                background: #d0d0d0;
+                border: 1px solid #aaaaaa;
+            }
+
+            /* Hide small triangle on menu buttons */
+            QToolButton::menu-indicator {
+                image: none;
+                width: 0px;
+                height: 0px;
+            }
+
+            QScrollArea {
+                background: #ffffff;
+            }
+            QScrollArea QWidget {
+                background: #ffffff;
+            }
+"""
+
+
+class PageScrollArea(QScrollArea):
+    """Scroll area that can flip pages with mouse wheel."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.on_scroll_prev = None
+        self.on_scroll_next = None
+
+    def wheelEvent(self, event):
+        if self.on_scroll_prev or self.on_scroll_next:
+            delta = event.angleDelta().y()
+            bar = self.verticalScrollBar()
+            at_top = bar.value() == bar.minimum()
+            at_bottom = bar.value() == bar.maximum()
+
+            if delta > 0 and at_top and self.on_scroll_prev:
+                self.on_scroll_prev()
+                return
+            if delta < 0 and at_bottom and self.on_scroll_next:
+                self.on_scroll_next()
+                return
+        super().wheelEvent(event)
+
+
+class SettingsDialog(QDialog):
+    def __init__(self, parent, fonts, current_font, current_size, current_theme, current_lang):
+        super().__init__(parent)
+        self.setModal(True)
+        self.setWindowTitle(LANG_STRINGS[current_lang]["settings_title"])
+
+        self.font_combo = QComboBox()
+        self.font_combo.addItems(fonts)
+        if current_font in fonts:
+            self.font_combo.setCurrentText(current_font)
+
+        self.size_spin = QSpinBox()
+        self.size_spin.setRange(8, 48)
+        self.size_spin.setValue(current_size)
+
+        self.theme_combo = QComboBox()
+        self.theme_combo.addItems(
+            [LANG_STRINGS[current_lang]["theme_light"], LANG_STRINGS[current_lang]["theme_dark"]]
+        )
+        if current_theme.lower() == "dark":
+            self.theme_combo.setCurrentIndex(1)
+        else:
+            self.theme_combo.setCurrentIndex(0)
+
+        self.lang_combo = QComboBox()
+        self.lang_combo.addItem(LANG_STRINGS[current_lang]["language_en"], "en")
+        self.lang_combo.addItem(LANG_STRINGS[current_lang]["language_th"], "th")
+        if current_lang == "th":
+            self.lang_combo.setCurrentIndex(1)
+        else:
+            self.lang_combo.setCurrentIndex(0)
+
+        layout = QVBoxLayout(self)
+
+        font_row = QHBoxLayout()
+        font_label = QLabel(LANG_STRINGS[current_lang]["font"] + ":")
+        font_row.addWidget(font_label)
+        font_row.addWidget(self.font_combo)
+
+        size_row = QHBoxLayout()
+        size_label = QLabel("Size:")
+        size_row.addWidget(size_label)
+        size_row.addWidget(self.size_spin)
+
+        theme_row = QHBoxLayout()
+        theme_label = QLabel(LANG_STRINGS[current_lang]["theme"] + ":")
+        theme_row.addWidget(theme_label)
+        theme_row.addWidget(self.theme_combo)
+
+        lang_row = QHBoxLayout()
+        lang_label = QLabel(LANG_STRINGS[current_lang]["language"] + ":")
+        lang_row.addWidget(lang_label)
+        lang_row.addWidget(self.lang_combo)
+
+        layout.addLayout(font_row)
+        layout.addLayout(size_row)
+        layout.addLayout(theme_row)
+        layout.addLayout(lang_row)
+
+        btn_row = QHBoxLayout()
+        ok_btn = QPushButton("OK")
+        cancel_btn = QPushButton("Cancel")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        btn_row.addStretch(1)
+        btn_row.addWidget(ok_btn)
+        btn_row.addWidget(cancel_btn)
+
+        layout.addLayout(btn_row)
+
+    def get_values(self):
+        theme = "light" if self.theme_combo.currentIndex() == 0 else "dark"
+        lang = self.lang_combo.currentData()
+        return {
+            "font_family": self.font_combo.currentText(),
+            "font_size": self.size_spin.value(),
+            "theme": theme,
+            "language": lang,
+        }
+
+
+class ConvertDialog(QDialog):
+    def __init__(self, parent, current_lang):
+        super().__init__(parent)
+        self.setModal(True)
+        self.current_lang = current_lang
+        self.setWindowTitle(LANG_STRINGS[current_lang]["convert_title"])
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("Text -> PDF", "text_pdf")
+        self.mode_combo.addItem("Text -> EPUB", "text_epub")
+        self.mode_combo.addItem("Images -> PDF", "images_pdf")
+
+        self.input_label = QLabel("Input: (none)")
+        self.output_label = QLabel("Output: (none)")
+
+        self.input_btn = QPushButton("Browse input")
+        self.output_btn = QPushButton("Browse output")
+        self.input_btn.clicked.connect(self.choose_input)
+        self.output_btn.clicked.connect(self.choose_output)
+
+        self.password_check = QCheckBox("Protect with password (PDF)")
+        self.password_edit = QLineEdit()
+        self.password_edit.setEchoMode(QLineEdit.Password)
+
+        self.convert_btn = QPushButton("Convert")
+        self.cancel_btn = QPushButton("Cancel")
+        self.convert_btn.clicked.connect(self.perform_convert)
+        self.cancel_btn.clicked.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Mode:"))
+        layout.addWidget(self.mode_combo)
+        layout.addWidget(self.input_label)
+        layout.addWidget(self.input_btn)
+        layout.addWidget(self.output_label)
+        layout.addWidget(self.output_btn)
+        layout.addWidget(self.password_check)
+        layout.addWidget(self.password_edit)
+
+        btn_row = QHBoxLayout()
+        btn_row.addStretch(1)
+        btn_row.addWidget(self.convert_btn)
+        btn_row.addWidget(self.cancel_btn)
+        layout.addLayout(btn_row)
+
+        self.input_paths = []
+        self.output_path = ""
+
+    def choose_input(self):
+        mode = self.mode_combo.currentData()
+        if mode == "images_pdf":
+            paths, _ = QFileDialog.getOpenFileNames(
+                self, "Select images", "", "Images (*.png *.jpg *.jpeg *.bmp)"
+            )
+            if paths:
+                self.input_paths = paths
+                self.input_label.setText(f"Input: {len(paths)} image(s) selected")
+        else:
+            path, _ = QFileDialog.getOpenFileName(
+                self, "Select text file", "", "Text files (*.txt);;All files (*.*)"
+            )
+            if path:
+                self.input_paths = [path]
+                self.input_label.setText(f"Input: {os.path.basename(path)}")
+
+    def choose_output(self):
+        mode = self.mode_combo.currentData()
+        if mode in ("text_pdf", "images_pdf"):
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Save PDF", "", "PDF files (*.pdf)"
+            )
+        else:
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Save EPUB", "", "EPUB files (*.epub)"
+            )
+        if path:
+            self.output_path = path
+            self.output_label.setText(f"Output: {os.path.basename(path)}")
+
+    def perform_convert(self):
+        mode = self.mode_combo.currentData()
+        if not self.input_paths:
+            QMessageBox.warning(self, "Error", "No input selected.")
+            return
+        if not self.output_path:
+            QMessageBox.warning(self, "Error", "No output selected.")
+            return
+
+        try:
+            if mode == "text_pdf":
+                self._convert_text_to_pdf()
+            elif mode == "text_epub":
+                self._convert_text_to_epub()
+            elif mode == "images_pdf":
+                self._convert_images_to_pdf()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Conversion failed:\n{e}")
+            return
+
+        QMessageBox.information(self, "Success", "Conversion completed.")
+        self.accept()
+
+    def _convert_text_to_pdf(self):
+        import fitz
+
+        path = self.input_paths[0]
+
+        doc = fitz.open()
+
+        # Paginate line by line with a precomputed metric instead of
+        # pushing everything through one insert_textbox reflow (which
+        # also silently truncates anything past the first page).
+        fontsize = 11
+        font = fitz.Font("helv")
+        line_height = (font.ascender - font.descender) * fontsize * 1.2
+        margin = 50
+
+        page = doc.new_page()
+        max_width = page.rect.width - 2 * margin
+        y = margin + line_height
+        for line in _iter_text_lines(path):
+            pieces = (
+                _wrap_pdf_line(line, font, fontsize, max_width)
+                if line
+                else ("",)
+            )
+            for piece in pieces:
+                if y > page.rect.height - margin:
+                    page = doc.new_page()
+                    y = margin + line_height
+                if piece:
+                    page.insert_text(
+                        (margin, y), piece, fontsize=fontsize, fontname="helv"
+                    )
+                y += line_height
+
+        if self.password_check.isChecked() and self.password_edit.text():
+            pw = self.password_edit.text()
+            doc.save(
+                self.output_path,
+                encryption=fitz.PDF_ENCRYPT_AES_128,
+                owner_pw=pw,
+                user_pw=pw,
+            )
+        else:
+            doc.save(self.output_path)
+
+        doc.close()
+
+    def _convert_text_to_epub(self):
+        from ebooklib import epub
+
+        path = self.input_paths[0]
+        with open(path, "rb") as f:
+            text = f.read().decode("utf-8", "ignore")
+
+        book = epub.EpubBook()
+        book.set_identifier("fereader-convert")
+        book.set_title(os.path.basename(path))
+        book.set_language("en")
+
+        chapter = epub.EpubHtml(title="Chapter 1", file_name="chap_1.xhtml", lang="en")
+        safe = html.escape(text, quote=False)
+        chapter.set_content(
+            b"<html><body><pre>" + safe.encode("utf-8") + b"</pre></body></html>"
+        )
+        book.add_item(chapter)
+
+        book.toc = (chapter,)
+        book.add_item(epub.EpubNcx())
+        book.add_item(epub.EpubNav())
+        book.spine = ["nav", chapter]
+
+        epub.write_epub(self.output_path, book)
+
+    def _convert_images_to_pdf(self):
+        import fitz
+
+        doc = fitz.open()
+
+        # Decode image headers in parallel (MuPDF releases the GIL);
+        # page assembly stays sequential.
+        workers = min(len(self.input_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            sizes = list(ex.map(_probe_image_size, self.input_paths))
+
+        for img_path, (width, height) in zip(self.input_paths, sizes):
+            page = doc.new_page(width=width, height=height)
+            if img_path.lower().endswith((".jpg", ".jpeg")):
+                # Pass the JPEG stream through verbatim (/DCTDecode)
+                # instead of decoding and re-encoding the pixels.
+                with open(img_path, "rb") as f:
+                    page.insert_image(page.rect, stream=f.read())
+            else:
+                page.insert_image(page.rect, filename=img_path)
+
+        if self.password_check.isChecked() and self.password_edit.text():
+            pw = self.password_edit.text()
+            doc.save(
+                self.output_path,
+                encryption=fitz.PDF_ENCRYPT_AES_128,
+                owner_pw=pw,
+                user_pw=pw,
+            )
+        else:
+            doc.save(self.output_path)
+        doc.close()
+
+
+class EpubTextBrowser(QTextBrowser):
+    """Text browser that resolves EPUB-internal resources from memory.
+
+    Chapter HTML references images and stylesheets by their path inside
+    the EPUB archive; ``resources`` maps those paths to raw bytes so no
+    temp-dir extraction is needed.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.resources = {}
+
+    def loadResource(self, rtype, url):
+        key = posixpath.normpath(url.toString()).lstrip("/")
+        data = self.resources.get(key)
+        if data is not None:
+            if rtype == QTextDocument.ImageResource:
+                return QImage.fromData(data)
+            return data
+        return super().loadResource(rtype, url)
+
+
+class _RenderSignals(QObject):
+    # (doc_path, page_index, zoom, samples, width, height, stride)
+    rendered = pyqtSignal(str, int, float, object, int, int, int)
+
+
+class PageRenderTask(QRunnable):
+    """Rasterize a single PDF page off the GUI thread.
+
+    MuPDF documents are not thread-safe, so each task opens its own
+    fitz.Document from the path instead of sharing the window's handle.
+    """
+
+    def __init__(self, doc_path, page_index, zoom, password, signals, cache_dir=None):
+        super().__init__()
+        self.doc_path = doc_path
+        self.page_index = page_index
+        self.zoom = zoom
+        self.password = password
+        self.signals = signals
+        self.cache_dir = cache_dir
+
+    def _cache_file(self):
+        if not self.cache_dir:
+            return None
+        return os.path.join(
+            self.cache_dir, f"{self.page_index}_{int(self.zoom * 1000)}.png"
+        )
+
+    def _emit_failure(self):
+        # A null payload still travels back to the GUI thread so the
+        # window can clear its pending-render entry and retry later.
+        self.signals.rendered.emit(
+            self.doc_path, self.page_index, self.zoom, None, 0, 0, 0
+        )
+
+    def _emit_image(self, img):
+        bits = img.bits()
+        bits.setsize(img.byteCount())
+        self.signals.rendered.emit(
+            self.doc_path,
+            self.page_index,
+            self.zoom,
+            bytes(bits),
+            img.width(),
+            img.height(),
+            img.bytesPerLine(),
+        )
+
+    def run(self):
+        import fitz
+
+        # Repeat opens skip rasterization entirely when the page is in
+        # the on-disk cache.
+        cache_file = self._cache_file()
+        if cache_file and os.path.exists(cache_file):
+            img = QImage(cache_file)
+            if not img.isNull():
+                try:
+                    os.utime(cache_file)
+                except OSError:
+                    pass
+                self._emit_image(img.convertToFormat(QImage.Format_RGB888))
+                return
+
+        try:
+            doc = fitz.open(self.doc_path)
+            if doc.needs_pass:
+                if not self.password or not doc.authenticate(self.password):
+                    doc.close()
+                    self._emit_failure()
+                    return
+            page = doc.load_page(self.page_index)
+            pix = page.get_pixmap(
+                matrix=fitz.Matrix(self.zoom, self.zoom), alpha=False
+            )
+            # Ship the raw sample bytes; the GUI thread wraps them in a
+            # QImage and converts to QPixmap without another memcpy.
+            samples = bytes(pix.samples)
+            width, height, stride = pix.width, pix.height, pix.stride
+            doc.close()
+        except Exception:
+            self._emit_failure()
+            return
+
+        if cache_file:
+            try:
+                QImage(
+                    samples, width, height, stride, QImage.Format_RGB888
+                ).save(cache_file, "PNG")
+            except OSError:
+                pass
+
+        self.signals.rendered.emit(
+            self.doc_path, self.page_index, self.zoom, samples, width, height, stride
+        )
+
+
+class ClickableLabel(QLabel):
+    clicked = pyqtSignal()
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
+
+class FeReaderWindow(QMainWindow):
+    _PIX_CACHE_MAX = 64
+    _EPUB_CACHE_MAX = 16
+
+    def __init__(self):
+        super().__init__()
+
+        self.config_path = str(CONFIG_DIR / "settings.ini")
+        self.config = configparser.ConfigParser()
+        self._load_or_create_settings()
+
+        self.language = self.config["General"]["language"]
+        self._bundle = LANG_STRINGS.get(self.language, LANG_STRINGS["en"])
+        self.theme = self.config["General"]["theme"]
+        self.font_family = self.config["General"]["font_family"]
+        self.base_font_size = int(self.config["General"]["font_size"])
+
+        self.current_book_type = None
+        self.current_book_path = None
+        self.current_book_title = "Untitled"
+        self.pages = []
+        self.current_index = 0
+        self.current_font_size = self.base_font_size
+        self.current_zoom = 1.0
+        self._doc = None
+        self._doc_path = None
+        self._doc_key = None
+        self._pdf_password = None
+        self._pix_cache = collections.OrderedDict()
+        self._pending_renders = set()
+        self._render_signals = _RenderSignals()
+        self._render_signals.rendered.connect(self._on_page_rendered)
+        # Dedicated pool so page renders never queue behind other global
+        # runnables; leave one core for the GUI thread.
+        self._render_pool = QThreadPool(self)
+        self._render_pool.setMaxThreadCount(max(2, (os.cpu_count() or 2) - 1))
+        self._disk_cache_dir = None
+        try:
+            _prune_page_cache()
+        except OSError:
+            pass
+        self._continuous_zoom = 1.0
+        self._epub_rendered = collections.OrderedDict()
+        # Resolved (chapter dir, src) -> archive path; books reuse the
+        # same relative image references across most chapters.
+        self._src_resolved = {}
+        self._page_labels = []
+        self._applied_theme = None
+        # Reusable objects for hot paths: the selection-highlight format
+        # and the reader font (rebuilt only when family/size change).
+        self._highlight_fmt = QTextCharFormat()
+        self._highlight_fmt.setBackground(QColor(255, 255, 0, 128))
+        self._reader_font = None
+        self._reader_font_key = None
+
+        # Shared Qt-wide pixmap cache; lets rendered pages survive
+        # view-mode toggles and repeat visits (limit is in KB).
+        QPixmapCache.setCacheLimit(256 * 1024)
+
+        # Debounce rapid zoom keystrokes: show a cheap preview per step
+        # and only render once the user pauses.
+        self._zoom_debounce = QTimer(self)
+        self._zoom_debounce.setSingleShot(True)
+        self._zoom_debounce.setInterval(120)
+        self._zoom_debounce.timeout.connect(self._update_view)
+        self.view_mode = "single"
+        self._continuous_needs_build = True
+
+        self._load_user_fonts()
+
+        self.setWindowTitle(f"FeReader - PDF & EPUB Viewer Version {APP_VERSION}")
+        self.resize(1000, 700)
+
+        self.stack = QStackedWidget()
+
+        self.text_view = EpubTextBrowser()
+        self.text_view.setOpenExternalLinks(True)
+        self.text_view.setFont(self._reader_qfont())
+        self.text_view.selectionChanged.connect(self._handle_text_selection)
+
+        self.single_image_label = QLabel()
+        self.single_image_label.setAlignment(Qt.AlignCenter)
+
+        self.single_scroll = PageScrollArea()
+        self.single_scroll.setWidgetResizable(True)
+        self.single_scroll.setWidget(self.single_image_label)
+        self.single_scroll.on_scroll_prev = self.go_prev
+        self.single_scroll.on_scroll_next = self.go_next
+
+        self.multi_container = QWidget()
+        self.multi_layout = QVBoxLayout(self.multi_container)
+        self.multi_layout.setAlignment(Qt.AlignHCenter | Qt.AlignTop)
+        self.multi_layout.setContentsMargins(0, 0, 0, 0)
+        self.multi_layout.setSpacing(16)
+
+        self.multi_scroll = QScrollArea()
+        self.multi_scroll.setWidgetResizable(True)
+        self.multi_scroll.setWidget(self.multi_container)
+        self.multi_scroll.verticalScrollBar().valueChanged.connect(
+            self._refresh_visible_pages
+        )
+
+        self.stack.addWidget(self.text_view)
+        self.stack.addWidget(self.single_scroll)
+        self.stack.addWidget(self.multi_scroll)
+        self.setCentralWidget(self.stack)
+
+        self._create_toolbar()
+        self._create_statusbar()
+
+        self.apply_theme()
+        self.apply_language()
+        self._update_view()
+
+    # ---------------- Settings handling ----------------
+
+    def _load_or_create_settings(self):
+        defaults = {
+            "theme": "light",
+            "font_family": "Segoe UI",
+            "font_size": "12",
+            "language": "en",
+        }
+        if os.path.exists(self.config_path):
+            try:
+                self.config.read(self.config_path, encoding="utf-8")
+            except Exception:
+                self.config = configparser.ConfigParser()
+        if "General" not in self.config:
+            self.config["General"] = {}
+        general = self.config["General"]
+        missing = [key for key in defaults if key not in general]
+        for key in missing:
+            general[key] = defaults[key]
+
+        # Only touch the file when a default actually had to be added.
+        if missing:
+            self._write_settings()
+
+    def _write_settings(self):
+        tmp_path = self.config_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            self.config.write(f)
+        os.replace(tmp_path, self.config_path)
+
+    def save_settings(self):
+        general = self.config["General"]
+        new_values = {
+            "theme": self.theme,
+            "font_family": self.font_family,
+            "font_size": str(self.base_font_size),
+            "language": self.language,
+        }
+        if all(general.get(key) == value for key, value in new_values.items()):
+            return
+        general.update(new_values)
+        self._write_settings()
+
+    def _load_user_fonts(self):
+        for name in os.listdir(APP_DIR):
+            if name.lower().endswith((".ttf", ".otf")):
+                try:
+                    QFontDatabase.addApplicationFont(os.path.join(APP_DIR, name))
+                except Exception:
+                    pass
+
+    # ---------------- Localization & theme ----------------
+
+    def tr(self, key):
+        return self._bundle.get(key, key)
+
+    def apply_language(self):
+        b = LANG_STRINGS.get(self.language, LANG_STRINGS["en"])
+        self._bundle = b
+
+        self.menu_button.setText(b["menu"])
+        self.prev_action.setText(b["prev"])
+        self.next_action.setText(b["next"])
+        self.goto_action.setText(b["goto"])
+        self.one_page_action.setText(b["one_page"])
+        self.all_pages_action.setText(b["all_pages"])
+        self.help_button.setText(b["help"])
+
+        self.menu_button.setToolTip(b["menu"])
+        self.help_button.setToolTip(b["help"])
+
+        self.open_action.setText(b["open"])
+        self.settings_action.setText(b["settings"])
+        self.convert_action.setText(b["convert"])
+        self.exit_action.setText(b["exit"])
+
+        self.view_help_action.setText(b["view_help"])
+        self.about_action.setText(b["about"])
+
+    def apply_theme(self):
+        """Apply light/dark theme including toolbar and hide menu indicators."""
+        if self.theme == self._applied_theme:
+            return
+        self.setStyleSheet(_DARK_QSS if self.theme == "dark" else _LIGHT_QSS)
+        self._applied_theme = self.theme
+
+    # ---------------- UI creation ----------------
+
+    def _create_toolbar(self):
+        toolbar = QToolBar("Main Toolbar")
+        toolbar.setMovable(False)
+        self.addToolBar(toolbar)
+
+        from PyQt5.QtWidgets import QToolButton, QMenu
+
+        self.menu_button = QToolButton()
+        self.menu_button.setPopupMode(QToolButton.InstantPopup)
+        self.menu_menu = QMenu()
+
+        # Actions with shortcuts (no shortcuts inside text)
+        self.open_action = QAction(self.tr("open"), self)
+        self.open_action.setShortcut(QKeySequence("Ctrl+O"))
+        self.open_action.triggered.connect(self.open_file)
+
+        self.settings_action = QAction(self.tr("settings"), self)
+        self.settings_action.setShortcut(QKeySequence("F1"))
+        self.settings_action.triggered.connect(self.open_settings_dialog)
+
+        self.convert_action = QAction(self.tr("convert"), self)
+        self.convert_action.setShortcut(QKeySequence("F2"))
+        self.convert_action.triggered.connect(self.open_convert_dialog)
+
+        self.exit_action = QAction(self.tr("exit"), self)
+        self.exit_action.setShortcut(QKeySequence("Alt+F4"))
+        self.exit_action.triggered.connect(QApplication.instance().quit)
+
+        self.menu_menu.addAction(self.open_action)
+        self.menu_menu.addAction(self.settings_action)
+        self.menu_menu.addAction(self.convert_action)
+        self.menu_menu.addSeparator()
+        self.menu_menu.addAction(self.exit_action)
+
+        self.menu_button.setMenu(self.menu_menu)
+        self.menu_button.setText(self.tr("menu"))
+        toolbar.addWidget(self.menu_button)
+
+        toolbar.addSeparator()
+
+        self.prev_action = QAction(self.tr("prev"), self)
+        self.prev_action.triggered.connect(self.go_prev)
+        toolbar.addAction(self.prev_action)
+
+        self.next_action = QAction(self.tr("next"), self)
+        self.next_action.triggered.connect(self.go_next)
+        toolbar.addAction(self.next_action)
+
+        self.goto_action = QAction(self.tr("goto"), self)
+        self.goto_action.triggered.connect(self.go_to_page_dialog)
+        toolbar.addAction(self.goto_action)
+
+        toolbar.addSeparator()
+
+        zoom_in_action = QAction("🔍+", self)
+        zoom_in_action.setStatusTip("Zoom in / increase font size")
+        zoom_in_action.triggered.connect(self.zoom_in)
+        toolbar.addAction(zoom_in_action)
+
+        zoom_out_action = QAction("🔍-", self)
+        zoom_out_action.setStatusTip("Zoom out / decrease font size")
+        zoom_out_action.triggered.connect(self.zoom_out)
+        toolbar.addAction(zoom_out_action)
+
+        # Clickable zoom label
+        self.zoom_label = ClickableLabel("100%")
+        self.zoom_label.setMinimumWidth(60)
+        self.zoom_label.setAlignment(Qt.AlignCenter)
+        self.zoom_label.clicked.connect(self.zoom_label_clicked)
+        toolbar.addWidget(self.zoom_label)
+
+        toolbar.addSeparator()
+
+        self.one_page_action = QAction(self.tr("one_page"), self)
+        self.one_page_action.setCheckable(True)
+        self.one_page_action.setChecked(True)
+
+        self.all_pages_action = QAction(self.tr("all_pages"), self)
+        self.all_pages_action.setCheckable(True)
+        self.all_pages_action.setChecked(False)
+
+        view_group = QActionGroup(self)
+        view_group.setExclusive(True)
+        view_group.addAction(self.one_page_action)
+        view_group.addAction(self.all_pages_action)
+
+        self.one_page_action.triggered.connect(lambda: self.set_view_mode("single"))
+        self.all_pages_action.triggered.connect(lambda: self.set_view_mode("continuous"))
+
+        toolbar.addAction(self.one_page_action)
+        toolbar.addAction(self.all_pages_action)
+
+        toolbar.addSeparator()
+
+        self.help_button = QToolButton()
+        self.help_button.setPopupMode(QToolButton.InstantPopup)
+        help_menu = QMenu()
+
+        self.view_help_action = QAction(self.tr("view_help"), self)
+        self.view_help_action.triggered.connect(
+            lambda: QDesktopServices.openUrl(
+                QUrl("https://github.com/Sauna-in-The-Sun/FeReader")
+            )
+        )
+        self.about_action = QAction(self.tr("about"), self)
+        self.about_action.triggered.connect(self.show_about)
+
+        help_menu.addAction(self.view_help_action)
+        help_menu.addAction(self.about_action)
+
+        self.help_button.setMenu(help_menu)
+        self.help_button.setText(self.tr("help"))
+        toolbar.addWidget(self.help_button)
+
+    def _create_statusbar(self):
+        status = QStatusBar()
+        self.setStatusBar(status)
+        self._update_statusbar()
+
+    def _update_statusbar(self):
+        if self.pages:
+            info = f"{self.current_book_title}  |  Page {self.current_index + 1} / {len(self.pages)}"
+        else:
+            info = self.tr("no_document")
+        self.statusBar().showMessage(info)
+
+    def _update_zoom_label(self):
+        """Update zoom label text (percentage) only."""
+        if not self.pages:
+            self.zoom_label.setText("100%")
+            return
+
+        if self.current_book_type == "pdf":
+            percent = int(self.current_zoom * 100)
+        else:
+            ratio = self.current_font_size / float(self.base_font_size)
+            percent = int(ratio * 100)
+
+        self.zoom_label.setText(f"{percent}%")
+
+    def zoom_label_clicked(self):
+        """Handle click on zoom label: let user type percentage."""
+        if not self.pages:
+            return
+
+        if self.current_book_type == "pdf":
+            current_percent = int(self.current_zoom * 100)
+        else:
+            current_percent = int(
+                self.current_font_size / float(self.base_font_size) * 100
+            )
+
+        value, ok = QInputDialog.getInt(
+            self,
+            "Set Zoom",
+            "Enter zoom percentage (50 - 300):",
+            value=current_percent,
+            min=50,
+            max=300,
+        )
+
+        if not ok:
+            return
+
+        if self.current_book_type == "pdf":
+            self.current_zoom = value / 100.0
+            if self.current_zoom < 0.5:
+                self.current_zoom = 0.5
+            if self.current_zoom > 3.0:
+                self.current_zoom = 3.0
+            if self.view_mode == "continuous":
+                self._continuous_needs_build = True
+        else:
+            new_size = int(self.base_font_size * (value / 100.0))
+            if new_size < 8:
+                new_size = 8
+            if new_size > 40:
+                new_size = 40
+            self.current_font_size = new_size
+
+        self._update_view()
+
+    # ---------------- File handling ----------------
+
+    def open_file(self):
+        dialog_filter = (
+            "Documents (*.pdf *.epub);;"
+            "PDF Files (*.pdf);;"
+            "EPUB Files (*.epub);;"
+            "All Files (*.*)"
+        )
+
+        path, _ = QFileDialog.getOpenFileName(self, "Open document", "", dialog_filter)
+        if not path:
+            return
+        ext = os.path.splitext(path)[1].lower()
+        try:
+            if ext == ".pdf":
+                self.load_pdf(path)
+            elif ext == ".epub":
+                self.load_epub(path)
+            else:
+                QMessageBox.warning(
+                    self, "Unsupported file", "Only PDF and EPUB are supported."
+                )
+                return
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to open file:\n{e}")
+            return
+
+        self.current_book_path = path
+        self.current_book_title = os.path.basename(path)
+        self.current_index = 0
+        self._update_view()
+
+    # -------- PDF (image-based rendering with PyMuPDF) --------
+
+    def _close_doc(self):
+        if self._doc is not None:
+            try:
+                self._doc.close()
+            except Exception:
+                pass
+        self._doc = None
+        self._doc_path = None
+        self._doc_key = None
+        self._pdf_password = None
+        self._disk_cache_dir = None
+        self._pix_cache.clear()
+        self._pending_renders.clear()
+
+    def load_pdf(self, path):
+        self.current_book_type = "pdf"
+        self.pages = []
+        self.current_zoom = 1.0
+        self.view_mode = "single"
+        self.one_page_action.setChecked(True)
+        self.all_pages_action.setChecked(False)
+        self._continuous_needs_build = True
+        self._close_doc()
+
+        import fitz
+
+        doc = fitz.open(path)
+
+        if doc.needs_pass:
+            password, ok = QInputDialog.getText(
+                self,
+                "Password Required",
+                "This PDF is encrypted.\nEnter password:",
+                QLineEdit.Password,
+            )
+            if not ok or not password:
+                QMessageBox.warning(self, "Cancelled", "Cannot open encrypted PDF.")
+                doc.close()
+                return
+            if not doc.authenticate(password):
+                QMessageBox.critical(self, "Error", "Incorrect password.")
+                doc.close()
+                return
+            self._pdf_password = password
+
+        self._doc = doc
+        self._doc_path = path
+        try:
+            self._doc_key = _doc_cache_key(path)
+        except OSError:
+            self._doc_key = path
+        self.pages = list(range(doc.page_count))
+
+        # Persist rendered pages across sessions; never cache decrypted
+        # pages of password-protected documents on disk.
+        if self._pdf_password is None:
+            try:
+                cache_dir = _get_page_cache_dir() / _doc_cache_key(path)
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                self._disk_cache_dir = str(cache_dir)
+            except OSError:
+                self._disk_cache_dir = None
+
+        # Warm only the first few pages; everything else renders on
+        # demand (plus prefetch) as the user navigates.
+        for index in self.pages[:4]:
+            self._request_page_render(index, self.current_zoom)
+
+    def _page_cache_key(self, key):
+        return f"pdf:{self._doc_key}:{key[0]}:{int(key[1] * 1000)}"
+
+    def _cached_page_pixmap(self, index, zoom):
+        """Return the cached pixmap for (index, zoom), requesting a
+        background render on a miss."""
+        key = (index, round(zoom, 3))
+        cached = self._pix_cache.get(key)
+        if cached is not None:
+            self._pix_cache.move_to_end(key)
+            return cached
+
+        # Second level: the global QPixmapCache (keys embed the document
+        # path, so entries for older documents simply age out).
+        pixmap = QPixmap()
+        if QPixmapCache.find(self._page_cache_key(key), pixmap):
+            self._pix_cache[key] = pixmap
+            if len(self._pix_cache) > self._PIX_CACHE_MAX:
+                self._pix_cache.popitem(last=False)
+            return pixmap
+
+        self._request_page_render(index, zoom)
+        return None
+
+    def _request_page_render(self, index, zoom):
+        if self._doc_path is None:
+            return
+        key = (index, round(zoom, 3))
+        if key in self._pix_cache or key in self._pending_renders:
+            return
+        self._pending_renders.add(key)
+        task = PageRenderTask(
+            self._doc_path,
+            index,
+            zoom,
+            self._pdf_password,
+            self._render_signals,
+            cache_dir=self._disk_cache_dir,
+        )
+        self._render_pool.start(task)
+
+    def _store_page_pixmap(self, key, pixmap):
+        self._pix_cache[key] = pixmap
+        self._pix_cache.move_to_end(key)
+        if len(self._pix_cache) > self._PIX_CACHE_MAX:
+            self._pix_cache.popitem(last=False)
+        QPixmapCache.insert(self._page_cache_key(key), pixmap)
+
+    def _on_page_rendered(self, doc_path, index, zoom, samples, width, height, stride):
+        key = (index, round(zoom, 3))
+        self._pending_renders.discard(key)
+        if doc_path != self._doc_path or self.current_book_type != "pdf":
+            return
+        if samples is None:
+            # Render failed; with the pending entry cleared the next
+            # view update may resubmit instead of leaving a blank page.
+            return
+
+        img = QImage(samples, width, height, stride, QImage.Format_RGB888)
+        pixmap = QPixmap.fromImage(img)
+        self._store_page_pixmap(key, pixmap)
+
+        current_zoom = self._render_zoom()
+        if self.view_mode == "single":
+            if index == self.current_index and key[1] == round(current_zoom, 3):
+                self.single_image_label.setPixmap(pixmap)
+                self.single_image_label.adjustSize()
+        elif not self._continuous_needs_build:
+            if key[1] == round(self._continuous_zoom, 3) and index < len(
+                self._page_labels
+            ):
+                lbl = self._page_labels[index]
+                lbl.setFixedSize(pixmap.size())
+                lbl.setPixmap(pixmap)
+
+    # -------- EPUB (HTML + inline images) --------
+
+    def load_epub(self, path):
+        self.current_book_type = "epub"
+        self.pages = []
+        self.current_font_size = self.base_font_size
+        self._close_doc()
+
+        import ebooklib
+        from ebooklib import epub
+
+        book = epub.read_epub(path)
+
+        # First pass: collect every asset path the chapters actually
+        # reference; publisher EPUBs often carry sizeable unused ones.
+        referenced = set()
+        assets = []
+        for item in book.get_items():
+            if item.get_type() == ebooklib.ITEM_DOCUMENT:
+                content = item.get_content()
+                html_dir = posixpath.dirname(item.file_name)
+                srcs = [
+                    match.group(2).decode("utf-8", "ignore")
+                    for match in _IMG_SRC_RE.finditer(content)
+                ]
+                if len(srcs) < len(_IMG_TAG_RE.findall(content)):
+                    # Same fallback the chapter rewriter uses: img
+                    # markup the regex cannot match still has to keep
+                    # its asset in memory.
+                    srcs.extend(_soup_img_srcs(content))
+                for src in srcs:
+                    referenced.add(
+                        posixpath.normpath(posixpath.join(html_dir, src))
+                    )
+            else:
+                assets.append(item)
+
+        # Stylesheets stay (they are small and may be linked); anything
+        # they point at via url(...) counts as referenced too.
+        for item in assets:
+            if item.get_type() == ebooklib.ITEM_STYLE:
+                css_dir = posixpath.dirname(item.file_name)
+                for match in _CSS_URL_RE.finditer(item.get_content()):
+                    ref = match.group(1).decode("utf-8", "ignore")
+                    referenced.add(
+                        posixpath.normpath(posixpath.join(css_dir, ref))
+                    )
+
+        # Serve referenced assets straight from memory instead of
+        # unpacking the archive to a temp directory.
+        resources = {}
+        for item in assets:
+            key = posixpath.normpath(item.file_name)
+            if item.get_type() == ebooklib.ITEM_STYLE or key in referenced:
+                resources[key] = item.get_content()
+        self.text_view.resources = resources
+
+        # Only index the spine eagerly; chapters are parsed on first view.
+        self._epub_rendered.clear()
+        self._src_resolved.clear()
+        self.pages = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+
+        if not self.pages:
+            self.pages.append("<h3>No readable content found.</h3>")
+
+    def _epub_chapter_html(self, index):
+        """Parse the chapter at the given spine position, memoized in a
+        bounded LRU so large books never hold every chapter at once."""
+        entry = self.pages[index]
+        if isinstance(entry, str):
+            return entry
+
+        cached = self._epub_rendered.get(index)
+        if cached is not None:
+            self._epub_rendered.move_to_end(index)
+            return cached
+
+        html_bytes = entry.get_content()
+        html_dir = posixpath.dirname(entry.file_name)
+
+        def _resolve_src(match):
+            src = match.group(2)
+            cache_key = (html_dir, src)
+            resolved = self._src_resolved.get(cache_key)
+            if resolved is None:
+                text = src.decode("utf-8", "ignore")
+                resolved = posixpath.normpath(posixpath.join(html_dir, text))
+                resolved = resolved.encode("utf-8")
+                self._src_resolved[cache_key] = resolved
+            return match.group(1) + resolved + match.group(3)
+
+        rewritten, matched = _IMG_SRC_RE.subn(_resolve_src, html_bytes)
+        if matched < len(_IMG_TAG_RE.findall(html_bytes)):
+            # Some <img> markup the regex could not handle (unquoted
+            # src, unusual attribute order); let the soup pass fix the
+            # remainder on the partially rewritten bytes.
+            clean_html = self._rewrite_chapter_soup(rewritten, html_dir)
+        else:
+            clean_html = rewritten.decode("utf-8", errors="ignore")
+
+        self._epub_rendered[index] = clean_html
+        if len(self._epub_rendered) > self._EPUB_CACHE_MAX:
+            self._epub_rendered.popitem(last=False)
+        return clean_html
+
+    def _rewrite_chapter_soup(self, html_bytes, html_dir):
+        """Fallback for documents whose <img> markup the regex missed.
+
+        Only <img> elements are parsed (SoupStrainer) and the fixed-up
+        src values are spliced back into the original bytes, so the rest
+        of the chapter is never built into a DOM or re-serialized.
+        """
+        resources = self.text_view.resources
+        done = set()
+        for src in _soup_img_srcs(html_bytes):
+            # One substitution covers every tag sharing this src, so
+            # repeats must be skipped; srcs the regex pass already
+            # resolved point at loaded resources and stay untouched.
+            if src in resources or src in done:
+                continue
+            done.add(src)
+            resolved = posixpath.normpath(posixpath.join(html_dir, src))
+            if resolved == src:
+                continue
+            resolved_bytes = resolved.encode("utf-8")
+            # Anchor to the src attribute so a filename mentioned in
+            # chapter text is left alone.
+            pattern = re.compile(
+                rb"(\bsrc\s*=\s*[\"']?)"
+                + re.escape(src.encode("utf-8"))
+                + rb"([\"'\s>])",
+                re.IGNORECASE,
+            )
+            html_bytes = pattern.sub(
+                lambda m: m.group(1) + resolved_bytes + m.group(2),
+                html_bytes,
+            )
+        return html_bytes.decode("utf-8", errors="ignore")
+
+    # ---------------- PDF continuous view helpers ----------------
+
+    def _ensure_page_labels(self, count):
+        """Grow or shrink the pooled continuous-view labels to count."""
+        while len(self._page_labels) < count:
+            lbl = QLabel()
+            lbl.setAlignment(Qt.AlignCenter)
+            self.multi_layout.addWidget(lbl)
+            self._page_labels.append(lbl)
+        while len(self._page_labels) > count:
+            lbl = self._page_labels.pop()
+            self.multi_layout.removeWidget(lbl)
+            lbl.deleteLater()
+
+    def _render_zoom(self):
+        """The zoom factor actually used for rendering and cache keys:
+        the requested zoom snapped to the fixed ladder."""
+        zoom = self.current_zoom if self.current_zoom > 0 else 1.0
+        return _snap_zoom(zoom)
+
+    def _build_continuous_pdf_widgets(self):
+        zoom = self._render_zoom()
+
+        # Suspend repaints while all labels are touched; inserting them
+        # one by one otherwise re-runs the layout once per page.
+        self.multi_container.setUpdatesEnabled(False)
+        try:
+            self._ensure_page_labels(len(self.pages))
+            for index, lbl in enumerate(self._page_labels):
+                lbl.clear()
+                rect = self._doc.load_page(index).rect
+                lbl.setFixedSize(int(rect.width * zoom), int(rect.height * zoom))
+        finally:
+            self.multi_container.setUpdatesEnabled(True)
+
+        self._continuous_zoom = zoom
+        self._continuous_needs_build = False
+
+        # Labels start as sized placeholders; only the ones near the
+        # viewport get pixels.
+        self.multi_layout.activate()
+        self._refresh_visible_pages()
+
+    def _refresh_visible_pages(self):
+        """Materialize pixmaps for labels near the viewport and release
+        those that have scrolled far away."""
+        if (
+            self.current_book_type != "pdf"
+            or self.view_mode != "continuous"
+            or self._continuous_needs_build
+            or not self._page_labels
+        ):
+            return
+
+        viewport = self.multi_scroll.viewport()
+        scroll_y = self.multi_scroll.verticalScrollBar().value()
+        visible = viewport.rect().translated(0, scroll_y)
+        margin = max(viewport.height(), 1)
+        render_zone = visible.adjusted(0, -margin, 0, margin)
+        keep_zone = visible.adjusted(0, -2 * margin, 0, 2 * margin)
+
+        zoom = self._continuous_zoom
+        for index, lbl in enumerate(self._page_labels):
+            geo = lbl.geometry()
+            if geo.intersects(render_zone):
+                pix = self._cached_page_pixmap(index, zoom)
+                if pix is not None and lbl.pixmap() is None:
+                    lbl.setPixmap(pix)
+            elif not geo.intersects(keep_zone):
+                lbl.clear()
+
+    # ---------------- Navigation & rendering ----------------
+
+    def _reader_qfont(self):
+        """The QFont for EPUB text, rebuilt only when family/size change."""
+        key = (self.font_family, self.current_font_size)
+        if key != self._reader_font_key:
+            self._reader_font = QFont(self.font_family, self.current_font_size)
+            self._reader_font_key = key
+        return self._reader_font
+
+    def _update_view(self):
+        if not self.pages:
+            self.stack.setCurrentWidget(self.text_view)
+            self.text_view.setPlainText(self.tr("no_document"))
+            self._update_statusbar()
+            self._update_zoom_label()
+            return
+
+        if self.current_book_type == "epub":
+            self.stack.setCurrentWidget(self.text_view)
+            content = self._epub_chapter_html(self.current_index)
+            self.text_view.setHtml(content)
+            self.text_view.setFont(self._reader_qfont())
+
+        elif self.current_book_type == "pdf":
+            if self.view_mode == "single":
+                self.stack.setCurrentWidget(self.single_scroll)
+                if self._doc is not None and 0 <= self.current_index < len(self.pages):
+                    zoom = self._render_zoom()
+                    pix = self._cached_page_pixmap(self.current_index, zoom)
+                    if pix is None:
+                        # Keep a fast-scaled stand-in up while the real
+                        # render is in flight.
+                        pix = self._zoom_preview_pixmap(self.current_index, zoom)
+                    if pix is not None:
+                        self.single_image_label.setPixmap(pix)
+                        self.single_image_label.adjustSize()
+                    else:
+                        self.single_image_label.clear()
+                else:
+                    self.single_image_label.clear()
+            else:
+                self.stack.setCurrentWidget(self.multi_scroll)
+                if self._continuous_needs_build:
+                    self._build_continuous_pdf_widgets()
+
+            # Warm the cache for the neighbouring pages once this paint
+            # has been flushed, so page flips feel instant.
+            QTimer.singleShot(0, self._prefetch_adjacent)
+
+        self._update_statusbar()
+        self._update_zoom_label()
+
+    def _nearest_cached_pixmap(self, index, zoom):
+        """Return (pixmap, zoom) for the cached render of this page best
+        suited as a stand-in for the target zoom, or None.
+
+        Renders at or above the target are preferred (downscaling a larger
+        render looks sharp; upscaling a smaller one blurs), picking the
+        smallest such level; only when none exists does the closest
+        lower-zoom render win.
+        """
+        best = None
+        for (i, z), pix in self._pix_cache.items():
+            if i != index:
+                continue
+            if best is None:
+                best = (pix, z)
+            elif z >= zoom:
+                if best[1] < zoom or z < best[1]:
+                    best = (pix, z)
+            elif best[1] < zoom and z > best[1]:
+                best = (pix, z)
+        return best
+
+    def _zoom_preview_pixmap(self, index, zoom):
+        """A FastTransformation-scaled stand-in shown while the real
+        render for this zoom is still in flight."""
+        nearest = self._nearest_cached_pixmap(index, zoom)
+        if nearest is None:
+            return None
+        pix, src_zoom = nearest
+        if src_zoom == zoom:
+            return pix
+        width = max(1, int(pix.width() * zoom / src_zoom))
+        return pix.scaledToWidth(width, Qt.FastTransformation)
+
+    def _preview_zoom_then_update(self):
+        """Immediate cheap feedback for a zoom step; the cache-filling
+        render happens when the debounce timer fires."""
+        if self.view_mode == "single":
+            preview = self._zoom_preview_pixmap(
+                self.current_index, self._render_zoom()
+            )
+            if preview is not None:
+                self.single_image_label.setPixmap(preview)
+                self.single_image_label.adjustSize()
+        self._update_zoom_label()
+        self._zoom_debounce.start()
+
+    def _prefetch_adjacent(self):
+        if self.current_book_type != "pdf" or self._doc is None:
+            return
+        zoom = self._render_zoom()
+        for index in (self.current_index + 1, self.current_index - 1):
+            if 0 <= index < len(self.pages):
+                self._request_page_render(index, zoom)
+
+    def go_prev(self):
+        if not self.pages:
+            return
+        if self.current_index > 0:
+            self.current_index -= 1
+            self._update_view()
+
+    def go_next(self):
+        if not self.pages:
+            return
+        if self.current_index < len(self.pages) - 1:
+            self.current_index += 1
+            self._update_view()
+
+    def go_to_page_dialog(self):
+        if not self.pages:
+            return
+        max_page = len(self.pages)
+        current_page_display = self.current_index + 1
+        value, ok = QInputDialog.getInt(
+            self,
+            "Go to page",
+            f"Enter page number (1 - {max_page}):",
+            value=current_page_display,
+            min=1,
+            max=max_page,
+        )
+        if ok and value - 1 != self.current_index:
+            self.current_index = value - 1
+            self._update_view()
+
+    # ---------------- Zoom ----------------
+
+    def zoom_in(self):
+        if not self.pages:
+            return
+        if self.current_book_type == "pdf":
+            self.current_zoom = _zoom_step(self.current_zoom, 1)
+            if self.view_mode == "continuous":
+                self._continuous_needs_build = True
+            self._preview_zoom_then_update()
+        else:
+            self.current_font_size += 1
+            if self.current_font_size > 40:
+                self.current_font_size = 40
+            self._update_view()
+
+    def zoom_out(self):
+        if not self.pages:
+            return
+        if self.current_book_type == "pdf":
+            self.current_zoom = _zoom_step(self.current_zoom, -1)
+            if self.view_mode == "continuous":
+                self._continuous_needs_build = True
+            self._preview_zoom_then_update()
+        else:
+            self.current_font_size -= 1
+            if self.current_font_size < 8:
+                self.current_font_size = 8
+            self._update_view()
+
+    # ---------------- View mode ----------------
+
+    def set_view_mode(self, mode: str):
+        if self.current_book_type != "pdf" or mode == self.view_mode:
+            return
+        if mode == "single":
+            self.view_mode = "single"
+            self.one_page_action.setChecked(True)
+            self.all_pages_action.setChecked(False)
+        elif mode == "continuous":
+            self.view_mode = "continuous"
+            self.one_page_action.setChecked(False)
+            self.all_pages_action.setChecked(True)
+            self._continuous_needs_build = True
+        else:
+            return
+        self._update_view()
+
+    # ---------------- Text highlight ----------------
+
+    def _handle_text_selection(self):
+        if self.current_book_type != "epub":
+            return
+        cursor = self.text_view.textCursor()
+        if not cursor or not cursor.hasSelection():
+            return
+        cursor.mergeCharFormat(self._highlight_fmt)
+
+    # ---------------- Settings / Help / Convert ----------------
+
+    def open_settings_dialog(self):
+        fonts = list(_all_font_families())
+        dlg = SettingsDialog(
+            self,
+            fonts,
+            self.font_family,
+            self.base_font_size,
+            self.theme,
+            self.language,
+        )
+        if dlg.exec_() == QDialog.Accepted:
+            values = dlg.get_values()
+            self.font_family = values["font_family"]
+            self.base_font_size = values["font_size"]
+            self.current_font_size = self.base_font_size
+            self.theme = values["theme"]
+            self.language = values["language"]
+            self.apply_theme()
+            self.apply_language()
+            self.save_settings()
+            self._update_view()
+
+    def open_convert_dialog(self):
+        dlg = ConvertDialog(self, self.language)
+        dlg.exec_()
+
+    def show_about(self):
+        text = (
+            f"FeReader Version {APP_VERSION}\n"
+            "PDF & EPUB Viewer with page navigation, zoom, and image support.\n"
+            "Powered by PyQt5, PyMuPDF, and ebooklib.\n"
+            "Copyright \u00a9 ImBad / Neofilisoft"
+        )
+        QMessageBox.information(self, "About FeReader", text)
+
+    # ---------------- Lifecycle ----------------
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # A taller viewport can expose placeholder labels that no scroll
+        # event will ever fill in.
+        self._refresh_visible_pages()
+
+    def closeEvent(self, event):
+        self._close_doc()
+        self.save_settings()
+        event.accept()
+
+
+def main():
+    app = QApplication(sys.argv)
+    window = FeReaderWindow()
+    window.show()
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()